@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import os
 import shutil
+import signal
 import subprocess
 import tarfile
 import tempfile
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 
-def _find_systemctl() -> Optional[str]:
+@functools.cache
+def systemctl_path() -> Optional[str]:
+    """Locate systemctl once, on first use; None where there is none (macOS)."""
     # Prefer typical absolute paths, then $PATH
     for cand in ("/bin/systemctl", "/usr/bin/systemctl"):
         if Path(cand).exists():
@@ -20,12 +25,12 @@ def _find_systemctl() -> Optional[str]:
     return found
 
 
-SYSTEMCTL: Optional[str] = _find_systemctl()
-
 DEST = Path("/opt/granturismo")
 ENV_FILE = Path("/etc/default/instrument-cluster-proxy")
 UNIT_NAME = "instrument-cluster-proxy.service"
 DEFAULT_OUTPUT = "udp://127.0.0.1:5600"
+CHUNK_SIZE = 1 << 20  # bytes per read while streaming the bundle
+STATUS_TTL = 1.0  # seconds a service_status() answer is reused
 
 DEFAULT_TARBALL_URL = (
     "https://github.com/chrshdl/granturismo/releases/download/v0.3.2/"
@@ -44,15 +49,176 @@ def _run(cmd: list[str]) -> subprocess.CompletedProcess:
         cmd,
         check=True,
         text=True,
+        stdin=subprocess.DEVNULL,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
     )
 
 
+@functools.cache
 def _tool_exists(name: str) -> bool:
     return shutil.which(name) is not None
 
 
+@functools.cache
+def _downloader() -> Optional[str]:
+    """'curl' or 'wget', whichever is installed (curl preferred), else None."""
+    for name in ("curl", "wget"):
+        if _tool_exists(name):
+            return name
+    return None
+
+
+def _download_cmd(url: str) -> list[str]:
+    """Command that streams `url` to stdout."""
+    if _downloader() == "curl":
+        return ["curl", "-L", "-sS", url]
+    return ["wget", "-q", "-O", "-", url]
+
+
+def _read_log(f) -> str:
+    f.seek(0)
+    return f.read().decode("utf-8", errors="replace").strip()
+
+
+def _gunzip_cmd() -> Optional[list[str]]:
+    """
+    External gzip decoder for the extract pipeline, fastest first.
+
+    pigz cannot split the inflate of a single-member gzip across cores; it
+    wins by moving reading, writing and CRC checking onto their own threads,
+    which is the most a monolithic .tar.gz allows.
+    """
+    if _tool_exists("unpigz"):
+        return ["unpigz", "-c"]
+    if _tool_exists("pigz"):
+        return ["pigz", "-dc"]
+    if _tool_exists("gzip"):
+        return ["gzip", "-dc"]
+    return None
+
+
+def _stream_extract(url: str, dest: Path, sha256: Optional[str] = None) -> str:
+    """
+    Download `url` and unpack the gzip'd tarball into `dest` in a single pass:
+    `curl -L url | unpigz -c | tar -x -C dest`. The bytes are hashed on their
+    way from the downloader to the decoder, so the tarball never touches the
+    disk. Without an external decoder tar inflates itself (`tar -xzf -`).
+
+    Without `tar`, Python's tarfile is the last resort. That path spools the
+    download to a temporary file first and extracts nothing if the digest
+    does not match `sha256`; members are unpacked with the "data" filter,
+    which rejects absolute paths and `..` escapes.
+
+    Returns the SHA256 hex digest of the downloaded bytes.
+    Raises subprocess.CalledProcessError if the download or extraction fails.
+    """
+    h = hashlib.sha256()
+    use_tar = _tool_exists("tar")
+    gunzip_cmd = _gunzip_cmd() if use_tar else None
+    gunzip = tar = None
+    with tempfile.TemporaryFile() as dl_err, tempfile.TemporaryFile() as tar_err:
+        dl = subprocess.Popen(
+            _download_cmd(url),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=dl_err,
+        )
+        try:
+            if use_tar:
+                if gunzip_cmd:
+                    gunzip = subprocess.Popen(
+                        gunzip_cmd,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=tar_err,
+                    )
+                    tar = subprocess.Popen(
+                        ["tar", "-xf", "-", "-C", str(dest)],
+                        stdin=gunzip.stdout,
+                        stdout=subprocess.DEVNULL,
+                        stderr=tar_err,
+                    )
+                    gunzip.stdout.close()  # tar owns the read end now
+                    head = gunzip
+                else:
+                    tar = subprocess.Popen(
+                        ["tar", "-xzf", "-", "-C", str(dest)],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.DEVNULL,
+                        stderr=tar_err,
+                    )
+                    head = tar
+                sink = head.stdin
+                buf = memoryview(bytearray(CHUNK_SIZE))
+                try:
+                    while n := dl.stdout.readinto(buf):
+                        chunk = buf[:n]
+                        h.update(chunk)
+                        if sink is None:
+                            continue
+                        try:
+                            sink.write(chunk)
+                        except BrokenPipeError:
+                            # tar may exit at the end-of-archive marker; keep
+                            # hashing the trailing padding
+                            sink = None
+                finally:
+                    try:
+                        head.stdin.close()
+                    except BrokenPipeError:
+                        pass
+                    if gunzip is not None:
+                        gunzip.wait()
+                    tar.wait()
+            else:
+                with tempfile.TemporaryFile() as spool:
+                    buf = memoryview(bytearray(CHUNK_SIZE))
+                    while n := dl.stdout.readinto(buf):
+                        chunk = buf[:n]
+                        h.update(chunk)
+                        spool.write(chunk)
+                    dl.wait()
+                    if dl.returncode == 0 and (
+                        not sha256 or h.hexdigest() == sha256.lower()
+                    ):
+                        spool.seek(0)
+                        # copybufsize sizes each member copy; default is a few KiB
+                        with tarfile.open(
+                            fileobj=spool, mode="r:gz", copybufsize=CHUNK_SIZE
+                        ) as tf:
+                            tf.extractall(dest, filter="data")
+        finally:
+            dl.stdout.close()
+            dl.wait()
+
+        if dl.returncode != 0:
+            raise subprocess.CalledProcessError(
+                dl.returncode, dl.args, output=_read_log(dl_err) or "Download failed"
+            )
+        # a decoder killed by SIGPIPE only means tar stopped reading early
+        if gunzip is not None and gunzip.returncode not in (0, -signal.SIGPIPE):
+            raise subprocess.CalledProcessError(
+                gunzip.returncode, gunzip.args, output=_read_log(tar_err)
+            )
+        if tar is not None and tar.returncode != 0:
+            raise subprocess.CalledProcessError(
+                tar.returncode, tar.args, output=_read_log(tar_err)
+            )
+    return h.hexdigest()
+
+
+def _promote(staging: Path, dest: Path) -> None:
+    """Move every top-level entry of `staging` into `dest`, replacing old ones."""
+    for entry in staging.iterdir():
+        target = dest / entry.name
+        if target.is_dir() and not target.is_symlink():
+            shutil.rmtree(target)
+        elif target.exists() or target.is_symlink():
+            target.unlink()
+        os.replace(entry, target)
+
+
 def _write(path: Path, content: str, mode: int = 0o644):
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(content, encoding="utf-8")
@@ -64,50 +230,82 @@ def is_installed() -> bool:
     return (DEST / "granturismo" / "proxy.py").exists() and (DEST / "vendor").exists()
 
 
+_status_cache: Optional[tuple[float, str]] = None
+
+
+def _forget_status() -> None:
+    global _status_cache
+    _status_cache = None
+
+
 def service_status() -> str:
     """
     Return 'active', 'inactive', 'failed', etc., for the preinstalled unit.
     On systems without systemctl (e.g. macOS), return 'unavailable'.
+    Answers are reused for STATUS_TTL seconds to avoid respawning systemctl.
     """
-    if SYSTEMCTL is None:
+    global _status_cache
+    sc = systemctl_path()
+    if sc is None:
         return "unavailable"
+
+    now = time.monotonic()
+    if _status_cache is not None and now - _status_cache[0] < STATUS_TTL:
+        return _status_cache[1]
+
     try:
-        cp = _run([SYSTEMCTL, "is-active", UNIT_NAME])
-        return cp.stdout.strip()
+        cp = _run([sc, "is-active", UNIT_NAME])
+        status = cp.stdout.strip()
     except subprocess.CalledProcessError as e:
         # systemd returns non-zero for inactive/failed; capture text safely
-        return (e.stdout or "inactive").strip()
+        status = (e.stdout or "inactive").strip()
+    _status_cache = (now, status)
+    return status
 
 
-def start_service() -> InstallResult:
-    if SYSTEMCTL is None:
+def start_service(reload: bool = False) -> InstallResult:
+    """
+    Enable + start the unit. Pass reload=True only after the unit file itself
+    changed on disk; a daemon-reload re-parses every unit on the system.
+    """
+    sc = systemctl_path()
+    if sc is None:
         return InstallResult(False, "systemctl not available on this OS")
     try:
-        _run([SYSTEMCTL, "daemon-reload"])
-        _run([SYSTEMCTL, "enable", "--now", UNIT_NAME])
+        if reload:
+            _run([sc, "daemon-reload"])
+        _run([sc, "enable", "--now", UNIT_NAME])
         return InstallResult(True, f"Started {UNIT_NAME}")
     except subprocess.CalledProcessError as e:
         return InstallResult(False, e.stdout)
+    finally:
+        _forget_status()
 
 
 def restart_service() -> InstallResult:
-    if SYSTEMCTL is None:
+    sc = systemctl_path()
+    if sc is None:
         return InstallResult(False, "systemctl not available on this OS")
     try:
-        _run([SYSTEMCTL, "restart", UNIT_NAME])
+        _run([sc, "restart", UNIT_NAME])
         return InstallResult(True, f"Restarted {UNIT_NAME}")
     except subprocess.CalledProcessError as e:
         return InstallResult(False, e.stdout)
+    finally:
+        _forget_status()
 
 
 def stop_service() -> InstallResult:
-    if SYSTEMCTL is None:
+    sc = systemctl_path()
+    if sc is None:
         return InstallResult(False, "systemctl not available on this OS")
     try:
-        _run([SYSTEMCTL, "disable", "--now", UNIT_NAME])
+        _run([sc, "disable", "--now", UNIT_NAME])
         return InstallResult(True, f"Stopped {UNIT_NAME}")
     except subprocess.CalledProcessError as e:
         return InstallResult(False, e.stdout)
+    finally:
+        _forget_status()
 
 
 def install_from_url(
@@ -125,43 +323,33 @@ def install_from_url(
     if not ps_ip:
         return InstallResult(False, "PS5 IP missing")
 
-    if not _tool_exists("curl") and not _tool_exists("wget"):
+    if _downloader() is None:
         return InstallResult(False, "Need curl or wget to download the tarball")
 
     DEST.mkdir(parents=True, exist_ok=True)
 
-    # 1) Download to a temp file
-    tmp = Path(tempfile.mkstemp(prefix="granturismo-", suffix=".tar.gz")[1])
+    # 1) Stream download -> tar into a staging dir, hashing on the fly
+    staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=DEST))
     try:
         try:
-            if _tool_exists("curl"):
-                _run(["curl", "-L", "-o", str(tmp), url])
-            else:
-                _run(["wget", "-O", str(tmp), url])
+            digest = _stream_extract(url, staging, sha256)
         except subprocess.CalledProcessError as e:
-            return InstallResult(False, e.stdout or "Download failed")
-
-        # 2) Optional integrity check
-        if sha256:
-            h = hashlib.sha256()
-            with tmp.open("rb") as f:
-                for chunk in iter(lambda: f.read(65536), b""):
-                    h.update(chunk)
-            if h.hexdigest().lower() != sha256.lower():
-                return InstallResult(False, "SHA256 mismatch; aborting")
-
-        # 3) Extract to /opt/granturismo (idempotent over existing)
+            return InstallResult(False, e.output or "Download failed")
+        except Exception as e:
+            return InstallResult(False, f"Extraction failed: {e}")
+
+        # 2) Optional integrity check; a mismatch never reaches DEST
+        if sha256 and digest.lower() != sha256.lower():
+            return InstallResult(False, "SHA256 mismatch; aborting")
+
+        # 3) Move into /opt/granturismo (idempotent over existing)
         try:
-            with tarfile.open(tmp, "r:gz") as tf:
-                tf.extractall(DEST)
+            _promote(staging, DEST)
         except Exception as e:
             return InstallResult(False, f"Extraction failed: {e}")
 
     finally:
-        try:
-            tmp.unlink(missing_ok=True)
-        except Exception:
-            pass
+        shutil.rmtree(staging, ignore_errors=True)
 
     # 4) /etc/default/simdash-proxy with PS IP and output
     output = jsonl_output or DEFAULT_OUTPUT
@@ -172,18 +360,22 @@ def install_from_url(
         return InstallResult(False, f"Failed to write {ENV_FILE}: {e}")
 
     # 5) Enable + start the service (if available)
-    if SYSTEMCTL is None:
+    sc = systemctl_path()
+    if sc is None:
         # On macOS/CI: installation is still successful; just can't manage service here.
         return InstallResult(
             True,
             "Installed bundle; service control unavailable on this OS (no systemctl).",
         )
 
+    # the unit is preinstalled and only its EnvironmentFile changed, which
+    # systemd reads on start, so no daemon-reload is needed here
     try:
-        _run([SYSTEMCTL, "daemon-reload"])
-        _run([SYSTEMCTL, "enable", "--now", UNIT_NAME])
+        _run([sc, "enable", "--now", UNIT_NAME])
     except subprocess.CalledProcessError as e:
         return InstallResult(False, e.stdout or "Failed to enable/start service")
+    finally:
+        _forget_status()
 
     st = service_status()
     return InstallResult(True, f"Installed bundle, service: {st}")
@@ -1,7 +1,13 @@
 import glob
 import os
+import time
 from typing import Optional, Tuple
 
+READ_TTL = 0.5  # seconds a get_percent() answer is reused
+
+# brightness file -> (monotonic time, percent), shared by all instances
+_percent_cache: dict[str, Tuple[float, int]] = {}
+
 
 class Backlight:
     """
@@ -44,11 +50,18 @@ class Backlight:
         return cur, maxv
 
     def get_percent(self) -> Optional[int]:
+        """Current brightness in percent; sysfs is read at most every READ_TTL."""
+        now = time.monotonic()
+        hit = _percent_cache.get(self._brightness_path)
+        if hit is not None and now - hit[0] < READ_TTL:
+            return hit[1]
         raw = self.get_raw()
         if not raw:
             return None
         cur, maxv = raw
-        return int(round((cur / maxv) * 100.0))
+        percent = int(round((cur / maxv) * 100.0))
+        _percent_cache[self._brightness_path] = (now, percent)
+        return percent
 
     def set_percent(self, percent: int) -> bool:
         """Between 10..100, returns True on success."""
@@ -63,6 +76,8 @@ class Backlight:
         try:
             with open(self._brightness_path, "w") as f:
                 f.write(str(value))
-            return True
         except Exception:
+            _percent_cache.pop(self._brightness_path, None)
             return False
+        _percent_cache[self._brightness_path] = (time.monotonic(), p)
+        return True
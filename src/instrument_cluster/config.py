@@ -1,5 +1,6 @@
 import json
-from dataclasses import asdict, dataclass, field
+import os
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Optional
 
@@ -21,27 +22,32 @@ class Config:
 
     @classmethod
     def parse_config(cls, path: Path) -> "Config":
-        config = {}
-        LOGGER.debug(
-            f'Config path "{path}" exists: {path.exists()} is file: {path.is_file()}'
-        )
-        if path.exists() and path.is_file():
-            with open(path, "r") as f:
-                config = json.load(f)
+        missing = False
+        try:
+            config = json.loads(path.read_bytes())
+        except FileNotFoundError:
+            config, missing = {}, True
+        except IsADirectoryError:
+            config = {}
+        LOGGER.debug(f'Config path "{path}" missing: {missing}')
 
         result = Config(**config)
         LOGGER.info(f"Config: {result}")
 
-        if not path.exists():
+        if missing:
             result.write_to_file(path)
 
         return result
 
     def write_to_file(self, path: Path) -> None:
         LOGGER.debug(f"Write config to {path}")
-        config_dict = asdict(self)
+        # shallow on purpose: asdict() deep-copies every value just to serialise it
+        config_dict = {f.name: getattr(self, f.name) for f in fields(self)}
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(config_dict, indent=4))
+        # write a sibling and rename, readers never see a half-written file
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(config_dict, indent=4))
+        os.replace(tmp, path)
 
 
 class ConfigManager:
@@ -49,30 +55,64 @@ class ConfigManager:
         Path.home() / ".config" / "instrument-cluster" / "config.json"
     )  # default path
     _config: Optional[Config] = None
+    _stamp: Optional[tuple[Path, int, int]] = None  # file the cache was built from
 
     @classmethod
     def set_path(cls, path: Path) -> None:
         cls.path = path
 
+    @classmethod
+    def _file_stamp(cls) -> Optional[tuple[Path, int, int]]:
+        try:
+            st = cls.path.stat()
+        except OSError:
+            return None
+        return (cls.path, st.st_mtime_ns, st.st_size)
+
     @classmethod
     def get_config(cls) -> Config:
         if cls._config is None:
             cls._config = Config.parse_config(cls.path)
+            cls._stamp = cls._file_stamp()
+        return cls._config
+
+    @classmethod
+    def reload(cls) -> Config:
+        """
+        Pick up external edits: re-parse only if the file on disk changed
+        (other path, mtime or size) and copy the values into the cached
+        Config, so holders of it and its runtime-only attributes stay valid.
+        A vanished file keeps the cached values.
+        """
+        if cls._config is None:
+            return cls.get_config()
+        stamp = cls._file_stamp()
+        if stamp is not None and stamp != cls._stamp:
+            fresh = Config.parse_config(cls.path)
+            for f in fields(fresh):
+                setattr(cls._config, f.name, getattr(fresh, f.name))
+            cls._stamp = stamp
         return cls._config
 
+    @classmethod
+    def _save(cls, cfg: Config) -> None:
+        """Persist `cfg` and adopt the new file stamp, so it is not re-parsed."""
+        cfg.write_to_file(cls.path)
+        cls._stamp = cls._file_stamp()
+
     @classmethod
     def set_telemetry_mode(cls, mode: TelemetryMode | str) -> None:
         cfg = cls.get_config()
         cfg.telemetry_mode = (
             mode.value if isinstance(mode, TelemetryMode) else TelemetryMode(mode).value
         )
-        cfg.write_to_file(cls.path)
+        cls._save(cfg)
 
     @classmethod
     def set_brightness_percent(cls, brightness: str) -> None:
         cfg = cls.get_config()
         cfg.brightness = brightness
-        cfg.write_to_file(cls.path)
+        cls._save(cfg)
 
     @classmethod
     def last_connected(cls, ip_address: str) -> None:
@@ -86,4 +126,4 @@ class ConfigManager:
         if ip_address in config.recent_connected:
             config.recent_connected.remove(ip_address)
         config.recent_connected.insert(0, ip_address)
-        config.write_to_file(cls.path)
+        cls._save(config)
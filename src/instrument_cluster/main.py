@@ -1,10 +1,12 @@
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import pygame
 
 from .config import Config, ConfigManager
 from .states.dashboard_state import DashboardState
 from .states.state_manager import StateManager
+from .ui.widgets.base.button import invalidate_screen_size
 
 
 def run(conf: Config) -> int:
@@ -20,25 +22,30 @@ def run(conf: Config) -> int:
     clock = pygame.time.Clock()
     fps = 30
 
-    while running:
-        dt = clock.tick(fps) / 1000
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    take_screenshot = True
-            state_manager.handle_event(event)
-        state_manager.update(dt)
-        dirty_rects = state_manager.draw(screen)
-        if dirty_rects:
-            pygame.display.update(dirty_rects)
-
-        if take_screenshot:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"IC_{timestamp}.png"
-            pygame.image.save(screen.convert(24), filename)
-            take_screenshot = False
+    # one worker: screenshots are written in order, off the render loop
+    with ThreadPoolExecutor(max_workers=1) as saver:
+        while running:
+            dt = clock.tick(fps) / 1000
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_SPACE:
+                        take_screenshot = True
+                elif event.type == pygame.VIDEORESIZE:
+                    invalidate_screen_size()
+                state_manager.handle_event(event)
+            state_manager.update(dt)
+            dirty_rects = state_manager.draw(screen)
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+
+            if take_screenshot:
+                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"IC_{timestamp}.png"
+                # copy on this thread, encode the PNG on the saver thread
+                saver.submit(pygame.image.save, screen.convert(24), filename)
+                take_screenshot = False
 
     pygame.quit()
     return 0
@@ -1,16 +1,17 @@
+from __future__ import annotations
+
 from typing import Optional
 
+import pygame
 from pygame.sprite import LayeredDirty
 
 from ..backlight import Backlight
 from ..config import Config, ConfigManager
 from ..logger import Logger
-from ..states.setup_state import SetupState
 from ..states.state import State
 from ..states.state_manager import StateManager
 from ..telemetry.feed import Feed
 from ..telemetry.mode import TelemetryMode
-from ..telemetry.models import TelemetryFrame
 from ..telemetry.source import TelemetrySource
 from ..ui.colors import Color
 from ..ui.constants import (
@@ -25,7 +26,7 @@ from ..ui.events import (
     BUTTON_SETUP_RELEASED,
 )
 from ..ui.utils import FontFamily, load_font
-from ..ui.widgets.base.button import Button, ButtonEvents
+from ..ui.widgets.base.button import Button, ButtonEvents, ButtonState
 from ..ui.widgets.delta_time_widget import DeltaTimeWidget
 from ..ui.widgets.fastest_lap_time_widget import FastestLapTimeWidget
 from ..ui.widgets.gear_widget import GearWidget
@@ -34,12 +35,17 @@ from ..ui.widgets.lap_widget import LapWidget
 from ..ui.widgets.predicted_lap_time_widget import PredictedLapTimeWidget
 from ..ui.widgets.speed_widget import SpeedWidget
 
+_BLACK = Color.BLACK.rgb()
+_WHITE = Color.WHITE.rgb()
+# share of the screen above which the dirty rects go out as one full update
+_FULL_UPDATE_RATIO = 0.8
+
 
 class DashboardState(State):
     def __init__(
         self,
         state_manager: StateManager = None,
-        telemetry: Optional[TelemetryFrame] = None,
+        telemetry: Optional[TelemetrySource] = None,
     ):
         super().__init__(state_manager)
         self.logger = Logger(__class__.__name__).get()
@@ -48,10 +54,10 @@ class DashboardState(State):
         # T E L E M E T R Y
         # -----------------------------------------------
         cfg: Config = ConfigManager.get_config()
-        self._last_mode: TelemetryMode = TelemetryMode(cfg.telemetry_mode)
+        mode = TelemetryMode(cfg.telemetry_mode)
+        self._last_mode: TelemetryMode = mode
 
         if telemetry is None:
-            mode = TelemetryMode(cfg.telemetry_mode)
             self.telemetry = TelemetrySource(
                 mode=mode,
                 host=cfg.udp_host,
@@ -62,9 +68,6 @@ class DashboardState(State):
 
         self.packet = None
 
-        self.ui = LayeredDirty()
-        self.widgets = LayeredDirty()
-
         self.setup = Button(
             rect=(
                 FOOTER_BUTTONGROUP_X,
@@ -73,7 +76,7 @@ class DashboardState(State):
                 BUTTON_HEIGHT,
             ),
             text="Setup",
-            text_color=Color.WHITE.rgb(),
+            text_color=_WHITE,
             text_gap=0,
             text_visible=True,
             text_position="top",
@@ -85,7 +88,7 @@ class DashboardState(State):
             font=load_font(size=32, family=FontFamily.PIXEL_TYPE),
             antialias=True,
             icon="\ue8b8",
-            icon_color=Color.WHITE.rgb(),
+            icon_color=_WHITE,
             icon_size=34,
             icon_position="center",
             icon_gap=0,
@@ -94,12 +97,12 @@ class DashboardState(State):
             icon_cell_width=34,
         )
 
-        self.ui.add(self.setup)
-
-        width = ConfigManager.get_config().width
-
-        gear_widget = GearWidget(rect=(width // 2, 388, 186, 232), show_border=False)
-        speed_widget = SpeedWidget(rect=(width // 2, 100, 220, 160), show_border=False)
+        gear_widget = GearWidget(
+            rect=(cfg.width // 2, 388, 186, 232), show_border=False
+        )
+        speed_widget = SpeedWidget(
+            rect=(cfg.width // 2, 100, 220, 160), show_border=False
+        )
         lap_widget = LapWidget(
             rect=(
                 922,
@@ -118,7 +121,8 @@ class DashboardState(State):
         )
         deltatime_widget = DeltaTimeWidget(rect=(870, 344, 286, 92), feed=feed)
 
-        self.widgets.add(
+        # telemetry-driven widgets take (packet, dt) in update()
+        self.widgets = [
             gear_widget,
             speed_widget,
             fastestlaptime_widget,
@@ -126,31 +130,51 @@ class DashboardState(State):
             laptime_widget,
             deltatime_widget,
             lap_widget,
-        )
+        ]
+
+        # membership is fixed, so the layered group is built once here and
+        # State.enter() just picks it up: widgets under the setup button
+        self.group = LayeredDirty()
+        self.group.add(*self.widgets, layer=0)
+        self.group.add(self.setup, layer=1)
 
     def background_color(self):
-        return Color.BLACK.rgb()
+        return _BLACK
 
     def draw_static_background(self, bg):
         pass
 
     def create_group(self):
-        # combine layers: widgets under UI
-        self.group = LayeredDirty()
-        for spr in self.widgets.sprites():
-            self.group.add(spr, layer=0)
-        for spr in self.ui.sprites():
-            self.group.add(spr, layer=1)
         return self.group
 
     def enter(self, screen):
         super().enter(screen)
+        self._screen_rect = screen.get_rect()
+        self._full_update_area = (
+            self._screen_rect.w * self._screen_rect.h * _FULL_UPDATE_RATIO
+        )
+        self._match_display_format()
         self.telemetry.start()
 
+        # re-read on purpose: brightness is persisted by SetupState at runtime
         bl = Backlight()
         if bl.available():
             bl.set_percent(ConfigManager.get_config().brightness)
 
+    def _match_display_format(self):
+        """
+        Convert sprite images that are not in the display's per-pixel alpha
+        format, so every blit in draw() is a plain copy and not a per-pixel
+        format conversion. Images already created via convert_alpha() are
+        left alone; widgets keep drawing into whatever self.image holds.
+        """
+        ref = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+        fmt = (ref.get_bitsize(), ref.get_masks())
+        for spr in self.group.sprites():
+            img = spr.image
+            if (img.get_bitsize(), img.get_masks()) != fmt:
+                spr.image = img.convert_alpha()
+
     def exit(self):
         self.telemetry.stop()
         super().exit()
@@ -162,35 +186,36 @@ class DashboardState(State):
         pass
 
     def draw(self, surface):
-        self.widgets.clear(surface, self.background)
-        self.ui.clear(surface, self.background)
-
-        dirty = []
-        dirty.extend(self.widgets.draw(surface))
-        dirty.extend(self.ui.draw(surface))
-
-        return dirty or []
+        dirty = self.group.draw(surface)
+        if not dirty:
+            return dirty
+        # past this point one blit of the whole screen beats many smaller ones
+        if sum(r.w * r.h for r in dirty) >= self._full_update_area:
+            return [self._screen_rect]
+        return dirty
 
     def update(self, dt: float):
         super().update(dt)
 
         # get fresh telemetry frame once per tick
-        packet = None
-        try:
-            packet = self.telemetry.latest()
-        except Exception:
-            packet = None
+        self.packet = self.telemetry.latest()
 
         # update telemetry-driven widgets with (packet, dt)
-        self.widgets.update(packet, dt)
+        for widget in self.widgets:
+            widget.update(self.packet, dt)
 
-        # update UI controls with (dt) only
-        self.ui.update(dt)
+        # update UI controls with (dt) only; an idle button has nothing to do,
+        # it only counts while pressed and resets the tick after a release
+        if self.setup.state is not ButtonState.IDLE:
+            self.setup.update(dt)
 
     def handle_event(self, event):
         self.setup.handle_event(event)
 
         if event.type == BUTTON_SETUP_RELEASED:
+            # local: the setup screens import this module back (enter_url_state)
+            from ..states.setup_state import SetupState
+
             self.state_manager.push_state(SetupState(self.state_manager))
             return True
         if event.type == BUTTON_SETUP_LONGPRESSED:
@@ -198,25 +223,20 @@ class DashboardState(State):
         return False
 
     def _reconfigure_telemetry_if_needed(self):
-        """Swap TelemetrySource if the persisted mode changed (e.g., DEMO <-> UDP)."""
-        cfg = ConfigManager.get_config()
+        """Switch the telemetry backend if the persisted mode changed (DEMO <-> UDP)."""
+        # runs on resume only; also picks up a hand-edited config file
+        cfg = ConfigManager.reload()
         desired_mode = TelemetryMode(cfg.telemetry_mode)
 
         if desired_mode == self._last_mode:
             return
 
         try:
-            self.telemetry.stop()
-        except Exception:
-            pass
-
-        try:
-            self.telemetry = TelemetrySource(
-                mode=desired_mode,
+            self.telemetry.reconfigure(
+                desired_mode,
                 host=cfg.udp_host,
                 port=cfg.udp_port,
             )
-            self.telemetry.start()
             self._last_mode = desired_mode
             self.logger.info(f"Telemetry mode switched to {desired_mode.name}")
         except Exception as e:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterable
+import ipaddress
+from typing import TYPE_CHECKING, Iterable, Iterator
 
 from pygame.sprite import LayeredDirty
 
@@ -46,6 +47,16 @@ if TYPE_CHECKING:
 
 
 class EnterIPState(State):
+    # PRESSED events are consumed; the RELEASED ones go to self._handlers
+    _CONSUMED = frozenset(
+        (
+            BUTTON_BACK_PRESSED,
+            ENTER_IP_KEYPAD_BUTTON_PRESSED,
+            ENTER_IP_DEL_BUTTON_PRESSED,
+            ENTER_IP_OK_BUTTON_PRESSED,
+        )
+    )
+
     def __init__(
         self,
         state_manager: StateManager = None,
@@ -54,6 +65,13 @@ class EnterIPState(State):
         super().__init__()
         self.state_manager = state_manager
         recent_connected = recent_connected or []
+        cfg = ConfigManager.get_config()
+        self._handlers = {
+            BUTTON_BACK_RELEASED: self.on_back_released,
+            ENTER_IP_KEYPAD_BUTTON_RELEASED: self.on_keypad_released,
+            ENTER_IP_DEL_BUTTON_RELEASED: self.on_keypad_released,
+            ENTER_IP_OK_BUTTON_RELEASED: self.on_ok_released,
+        }
         self.button_group: ButtonGroup = ButtonGroup()
         labels = list("123456789#0.")
 
@@ -161,7 +179,7 @@ class EnterIPState(State):
             pos=RECENT_CONNECTIONS_POSITION,
             center=True,
             antialias=False,
-            visible=len(ConfigManager.get_config().recent_connected) > 0,
+            visible=len(cfg.recent_connected) > 0,
         )
         self.textfield = TextField(
             text=get_ip_prefill(),
@@ -192,50 +210,33 @@ class EnterIPState(State):
         super().enter(screen)
 
     def draw(self, surface):
-        self.group.clear(surface, self.background)
         dirty = self.group.draw(surface)
-        return dirty or []
+        return dirty
 
     def handle_event(self, event):
-        self.button_group.handle_event(event)
-        self.textfield.handle_event(event)
+        if event.type in self.button_group.handled_types:
+            self.button_group.handle_event(event)
+        if event.type in self.textfield.handled_types:
+            self.textfield.handle_event(event)
+
+        handler = self._handlers.get(event.type)
+        if handler is not None:
+            return handler(event)
 
         # Consume relevant PRESSED events
-        if event.type in (
-            BUTTON_BACK_PRESSED,
-            BUTTON_BACK_RELEASED,
-            ENTER_IP_KEYPAD_BUTTON_PRESSED,
-            ENTER_IP_KEYPAD_BUTTON_RELEASED,
-            ENTER_IP_DEL_BUTTON_PRESSED,
-            ENTER_IP_DEL_BUTTON_RELEASED,
-            ENTER_IP_OK_BUTTON_PRESSED,
-            ENTER_IP_OK_BUTTON_RELEASED,
-        ):
-            if event.type == BUTTON_BACK_RELEASED:
-                return self.on_back_released(event)
-
-            if event.type in (
-                ENTER_IP_KEYPAD_BUTTON_RELEASED,
-                ENTER_IP_DEL_BUTTON_RELEASED,
-            ):
-                return self.on_keypad_released(event)
-
-            if event.type == ENTER_IP_OK_BUTTON_RELEASED:
-                return self.on_ok_released()
-            return True
-        return False  # not handled here
+        return event.type in self._CONSUMED
 
     def on_back_released(self, event):
         self.state_manager.change_state(SetupState(self.state_manager))
         return True
 
-    def on_ok_released(self):
-        ip = self.textfield.text.strip()
+    def on_ok_released(self, event=None, ip: str | None = None):
+        ip = (self.textfield.text if ip is None else ip).strip()
         if not self.is_valid_ipv4(ip):
             return True
 
         cfg = ConfigManager.get_config()
-        setattr(cfg, "playstation_ip", ip)
+        cfg.playstation_ip = ip
 
         self.state_manager.change_state(EnterURLState(self.state_manager))
         ConfigManager.last_connected(ip)
@@ -249,40 +250,29 @@ class EnterIPState(State):
         txt = tf.text
 
         if label == ".":
-            if txt.count(".") < 3 and "." not in txt[-1:]:
-                tf.set_text(txt + ".")
+            new_txt = txt + "." if txt.count(".") < 3 and txt[-1:] != "." else txt
         elif label == "<":
-            tf.set_text(txt[:-1])
-            tf.cursor_position = min(tf.cursor_position, len(tf.text))
+            new_txt = txt[:-1]
         elif label == "#":
-            pass
+            new_txt = txt
+        elif len(label) >= 7:
+            # a recent connection: submit it as is, without rendering it first
+            return self.on_ok_released(ip=label)
         else:
-            if len(label) >= 7:
-                tf.set_text(label)
-                self.on_ok_released()
-                return True
-            else:
-                tf.set_text(txt + label)
-                tf.cursor_position = len(tf.text)
-
-        tf.dirty = 1
+            new_txt = txt + label
+
+        # one re-render per key, and none when the key changed nothing
+        if new_txt != txt:
+            tf.set_text(new_txt)
+            tf.cursor_position = len(new_txt)
         return True
 
     def is_valid_ipv4(self, ip_str):
-        parts = ip_str.split(".")
-        if len(parts) != 4:
+        # dotted quad only; octets with leading zeros ("010") are rejected too
+        try:
+            ipaddress.IPv4Address(ip_str)
+        except ValueError:
             return False
-        for part in parts:
-            if part == "":
-                return False
-            if len(part) > 1 and part.startswith("0"):
-                return False
-            try:
-                num = int(part)
-            except ValueError:
-                return False
-            if num < 0 or num > 255:
-                return False
         return True
 
     def update(self, dt):
@@ -296,8 +286,9 @@ class EnterIPState(State):
         grid_offset: tuple[int, int],
         global_offset: tuple[int, int],
         button_size: tuple[int, int],
-    ) -> list[Button]:
-        return [
+    ) -> Iterator[Button]:
+        font = load_font(size=34, family=FontFamily.NOTOSANS_REGULAR)
+        return (
             Button(
                 rect=(
                     i % buttons_per_row * grid_offset[0] + global_offset[0],
@@ -312,8 +303,8 @@ class EnterIPState(State):
                     released=ENTER_IP_KEYPAD_BUTTON_RELEASED,
                 ),
                 event_data={"label": val},
-                font=load_font(size=34, family=FontFamily.NOTOSANS_REGULAR),
+                font=font,
                 antialias=True,
             )
             for i, val in enumerate(labels or [])
-        ]
+        )
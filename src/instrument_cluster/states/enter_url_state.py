@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
+
 from pygame.sprite import LayeredDirty
 
 from ..addons.installer import (
@@ -23,6 +25,8 @@ from ..ui.utils import FontFamily, load_font
 from ..ui.widgets.base.button import Button, ButtonEvents, ButtonGroup
 from ..ui.widgets.base.label import Label
 from ..ui.widgets.base.line import Line
+from .dashboard_state import DashboardState
+from .setup_state import SetupState
 from .state import State
 
 
@@ -39,15 +43,23 @@ class EnterURLState(State):
         * telemetry mode switched to UDP, then return to Settings
     """
 
+    _CONSUMED = frozenset((BUTTON_BACK_PRESSED, INSTALL_PRESSED))
+
     def __init__(self, state_manager: StateManager = None):
         super().__init__(state_manager)
         self._error: str | None = None
         self._status: str | None = None
+        # install_from_url blocks for the whole download; it runs on this
+        # worker and update() picks up the result on the UI thread
+        self._executor: ThreadPoolExecutor | None = None
+        self._install: Future[InstallResult] | None = None
+        self._handlers = {
+            BUTTON_BACK_RELEASED: self.on_back_released,
+            INSTALL_RELEASED: self.on_install_released,
+        }
 
-        self._w, self._h = (
-            ConfigManager.get_config().width,
-            ConfigManager.get_config().height,
-        )
+        cfg = ConfigManager.get_config()
+        self._w, self._h = cfg.width, cfg.height
 
         self.title_label = Label(
             text="UDP Telemetry",
@@ -114,29 +126,35 @@ class EnterURLState(State):
     def enter(self, screen):
         super().enter(screen)
 
+    def exit(self):
+        # an install already running is left to finish on its own
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        super().exit()
+
     def draw(self, surface):
-        self.group.clear(surface, self.background)
         dirty = self.group.draw(surface)
-        return dirty or []
+        return dirty
 
     def handle_event(self, event) -> bool:
-        self.btns.handle_event(event)
+        if event.type in self.btns.handled_types:
+            self.btns.handle_event(event)
         # self.textfield.handle_event(event)
 
-        if event.type in (BUTTON_BACK_PRESSED, INSTALL_PRESSED):
-            return True
-
-        if event.type == BUTTON_BACK_RELEASED:
-            from .setup_state import SetupState
+        handler = self._handlers.get(event.type)
+        if handler is not None:
+            return handler(event)
 
-            self.state_manager.change_state(SetupState(self.state_manager))
-            return True
+        return event.type in self._CONSUMED
 
-        if event.type == INSTALL_RELEASED:
-            self._perform_install()
-            return True
+    def on_back_released(self, event):
+        self.state_manager.change_state(SetupState(self.state_manager))
+        return True
 
-        return False
+    def on_install_released(self, event):
+        self._perform_install()
+        return True
 
     def _perform_install(self):
         # Read URL and PS IP from config
@@ -147,14 +165,24 @@ class EnterURLState(State):
             self._error = "PS5 IP not set. Enter it first."
             return
 
+        if self._install is not None:
+            return  # already installing
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._error = None
+        self._status = "Downloading and installing..."
+        self._install = self._executor.submit(
+            install_from_url,
+            url=url,
+            ps_ip=ps_ip,
+            sha256="d2d18c2ce9533cbeb377acc447d8754c8a4de7ab6aed6e22c7c546e35b0667fc",
+            jsonl_output="udp://127.0.0.1:5600",
+        )
+
+    def _finish_install(self, future: Future[InstallResult]):
         try:
-            self._status = "Downloading and installing..."
-            res: InstallResult = install_from_url(
-                url=url,
-                ps_ip=ps_ip,
-                sha256="d2d18c2ce9533cbeb377acc447d8754c8a4de7ab6aed6e22c7c546e35b0667fc",
-                jsonl_output="udp://127.0.0.1:5600",
-            )
+            res = future.result()
         except Exception as e:
             self._error = f"Install failed: {e}"
             self._status = None
@@ -169,27 +197,17 @@ class EnterURLState(State):
         ConfigManager.set_telemetry_mode(TelemetryMode.UDP)
         self._status = f"Installed. Proxy status: {service_status()}"
 
-        from ..telemetry.source import TelemetrySource
-        from .dashboard_state import DashboardState
-
-        telemetry = TelemetrySource(
-            mode=ConfigManager.get_config().telemetry_mode,
-            host=ConfigManager.get_config().udp_host,
-            port=ConfigManager.get_config().udp_port,
-        )
-
+        # DashboardState.on_resume() picks up the new mode from the config
         self.state_manager.pop_state()  # pops EnterURLState
 
-        cur = self.state_manager.current_state
-        if isinstance(cur, DashboardState):
-            cur.set_telemetry(telemetry, update_config=False)
-        else:
-            from .dashboard_state import DashboardState
-
+        if not isinstance(self.state_manager.current_state, DashboardState):
             self.state_manager.change_state(
-                DashboardState(state_manager=self.state_manager, telemetry=telemetry)
+                DashboardState(state_manager=self.state_manager)
             )
 
     def update(self, dt):
         super().update(dt)
+        if self._install is not None and self._install.done():
+            future, self._install = self._install, None
+            self._finish_install(future)
         # self.textfield.update(dt)
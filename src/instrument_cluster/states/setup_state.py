@@ -21,6 +21,7 @@ from ..ui.events import (
     BRIGHTNESS_UP_RELEASED,
     BUTTON_BACK_PRESSED,
     BUTTON_BACK_RELEASED,
+    POINTER_EVENTS,
     TELEMETRY_MODE_PRESSED,
     TELEMETRY_MODE_RELEASED,
     TELEMETRY_MODE_SELECTED,
@@ -32,26 +33,40 @@ from ..ui.widgets.base.label import Label
 from ..ui.widgets.base.line import Line
 from .state import State
 
+_BLACK = Color.BLACK.rgb()
+_WHITE = Color.WHITE.rgb()
+
 
 class SetupState(State):
     STEP_PERCENT = 10
     y = 200
     OPTIONS = [TelemetryMode.DEMO, TelemetryMode.UDP]
+    OPTIONS_INDEX = {mode: i for i, mode in enumerate(OPTIONS)}
+    _DROPDOWN_CONSUMED = frozenset((TELEMETRY_MODE_PRESSED, TELEMETRY_MODE_RELEASED))
 
     def __init__(self, state_manager: StateManager | None = None):
         super().__init__(state_manager)
+        cfg = ConfigManager.get_config()
+        self._handlers = {
+            BUTTON_BACK_RELEASED: self.on_back_released,
+            BRIGHTNESS_DOWN_RELEASED: self.on_brightness_down_released,
+            BRIGHTNESS_UP_RELEASED: self.on_brightness_up_released,
+            TELEMETRY_MODE_SELECTED: self.on_telemetry_mode_selected,
+        }
+        font_48 = load_font(size=48, family=FontFamily.PIXEL_TYPE)
+        font_76 = load_font(size=76, family=FontFamily.PIXEL_TYPE)
 
         self.title_label = Label(
             text="System  settings",
             font=load_font(size=68, family=FontFamily.PIXEL_TYPE),
-            color=Color.WHITE.rgb(),
+            color=_WHITE,
             pos=HEADER_TITLE_TOPLEFT,
             center=False,
         )
         self.back_button = Button(
             rect=(*HEADER_BACKBUTTON_POSITION, *HEADER_BACKBUTTON_SIZE),
             text="x",
-            text_color=Color.WHITE.rgb(),
+            text_color=_WHITE,
             text_gap=0,
             text_visible=False,
             events=ButtonEvents(
@@ -61,7 +76,7 @@ class SetupState(State):
             font=load_font(size=50, family=FontFamily.PIXEL_TYPE),
             antialias=True,
             icon="\ue166",
-            icon_color=Color.WHITE.rgb(),
+            icon_color=_WHITE,
             icon_size=54,
             icon_position="center",
             icon_gap=0,
@@ -70,19 +85,20 @@ class SetupState(State):
         self.horizontal_line = Line()
 
         self._backlight = Backlight()
-        self.brightness_percent_value = ConfigManager.get_config().brightness
+        # int from here on; the JSON config does not enforce the type
+        self.brightness_percent_value = int(cfg.brightness)
         self.brightness_percent_label = Label(
             text=f"{self.brightness_percent_value} %",
-            font=load_font(size=48, family=FontFamily.PIXEL_TYPE),
-            color=Color.WHITE.rgb(),
+            font=font_48,
+            color=_WHITE,
             pos=(444, SetupState.y + 15),
             center=True,
         )
         self._error: Optional[str] = None
         self.brightness_label = Label(
             text="Brightness",
-            font=load_font(size=48, family=FontFamily.PIXEL_TYPE),
-            color=Color.WHITE.rgb(),
+            font=font_48,
+            color=_WHITE,
             pos=(50, SetupState.y),
             center=False,
         )
@@ -97,8 +113,8 @@ class SetupState(State):
                 pressed=BRIGHTNESS_DOWN_PRESSED,
                 released=BRIGHTNESS_DOWN_RELEASED,
             ),
-            font=load_font(size=76, family=FontFamily.PIXEL_TYPE),
-            text_color=Color.WHITE.rgb(),
+            font=font_76,
+            text_color=_WHITE,
             antialias=True,
         )
         self.plus_button = Button(
@@ -112,21 +128,19 @@ class SetupState(State):
                 pressed=BRIGHTNESS_UP_PRESSED,
                 released=BRIGHTNESS_UP_RELEASED,
             ),
-            font=load_font(size=76, family=FontFamily.PIXEL_TYPE),
-            text_color=Color.WHITE.rgb(),
+            font=font_76,
+            text_color=_WHITE,
             antialias=True,
         )
 
         self.telemetry_label = Label(
             text="Telemetry",
-            font=load_font(size=48, family=FontFamily.PIXEL_TYPE),
-            color=Color.WHITE.rgb(),
+            font=font_48,
+            color=_WHITE,
             pos=(50, SetupState.y + 140),
             center=False,
         )
-        self._mode: Optional[TelemetryMode] = TelemetryMode(
-            ConfigManager.get_config().telemetry_mode
-        )
+        self._mode: Optional[TelemetryMode] = TelemetryMode(cfg.telemetry_mode)
         self.telemetry_mode_dropdown = Dropdown(
             rect=(280, SetupState.y + 150 - 30, 320, 80),
             options=SetupState.OPTIONS,
@@ -136,17 +150,12 @@ class SetupState(State):
                 selected=TELEMETRY_MODE_SELECTED,
             ),
             font=load_font(size=40, family=FontFamily.PIXEL_TYPE),
-            selected_index=SetupState.OPTIONS.index(self._mode),
+            selected_index=SetupState.OPTIONS_INDEX[self._mode],
         )
 
-    def background_color(self):
-        return Color.BLACK.rgb()
-
-    def draw_static_background(self, bg):
-        self.horizontal_line.draw(bg)
-
-    def create_group(self):
-        return LayeredDirty(
+        # membership is fixed, so the group is built once and State.enter()
+        # just picks it up, also when this state is entered again
+        self.group = LayeredDirty(
             [
                 self.title_label,
                 self.back_button,
@@ -159,6 +168,23 @@ class SetupState(State):
             ]
         )
 
+        # everything here that takes input; they all react to pointer events only
+        self._inputs = (
+            self.back_button,
+            self.plus_button,
+            self.minus_button,
+            self.telemetry_mode_dropdown,
+        )
+
+    def background_color(self):
+        return _BLACK
+
+    def draw_static_background(self, bg):
+        self.horizontal_line.draw(bg)
+
+    def create_group(self):
+        return self.group
+
     def enter(self, screen):
         super().enter(screen)
 
@@ -178,48 +204,23 @@ class SetupState(State):
             self._error = "No device found."
 
     def handle_event(self, event):
-        self.back_button.handle_event(event)
-        self.plus_button.handle_event(event)
-        self.minus_button.handle_event(event)
-        self.telemetry_mode_dropdown.handle_event(event)
-
-        if event.type == BUTTON_BACK_RELEASED:
-            return self.on_back_released(event)
-        if event.type == BRIGHTNESS_DOWN_RELEASED:
-            self.adjust_brightness(-SetupState.STEP_PERCENT)
-            return True
-        if event.type == BRIGHTNESS_UP_RELEASED:
-            self.adjust_brightness(+SetupState.STEP_PERCENT)
-            return True
-        if event.type in (TELEMETRY_MODE_PRESSED, TELEMETRY_MODE_RELEASED):
-            return True  # swallow so it doesn’t retrigger handle_event on the dropdown
-        if event.type == TELEMETRY_MODE_SELECTED:
-            if event.mode is TelemetryMode.UDP:
-                self._mode = TelemetryMode.UDP
-                from .enter_ip_state import EnterIPState
-
-                self.state_manager.change_state(
-                    EnterIPState(
-                        state_manager=self.state_manager,
-                        recent_connected=(
-                            ConfigManager.get_config().recent_connected or []
-                        ),
-                    )
-                )
-                return True
-            else:
-                ConfigManager.set_telemetry_mode(TelemetryMode.DEMO)
-                self._mode = TelemetryMode.DEMO
-                return True
-        return False
+        if event.type in POINTER_EVENTS:
+            for widget in self._inputs:
+                widget.handle_event(event)
+
+        handler = self._handlers.get(event.type)
+        if handler is not None:
+            return handler(event)
+
+        # swallow so it doesn’t retrigger handle_event on the dropdown
+        return event.type in self._DROPDOWN_CONSUMED
 
     def update(self, dt):
         super().update(dt)
 
     def draw(self, surface):
-        self.group.clear(surface, self.background)
         dirty = self.group.draw(surface)
-        return dirty or []
+        return dirty
 
     def on_back_released(self, event):
         persisted_brightness = ConfigManager.get_config().brightness
@@ -228,14 +229,39 @@ class SetupState(State):
         self.state_manager.pop_state()
         return True
 
+    def on_brightness_down_released(self, event):
+        self.adjust_brightness(-SetupState.STEP_PERCENT)
+        return True
+
+    def on_brightness_up_released(self, event):
+        self.adjust_brightness(+SetupState.STEP_PERCENT)
+        return True
+
+    def on_telemetry_mode_selected(self, event):
+        if event.mode is TelemetryMode.UDP:
+            self._mode = TelemetryMode.UDP
+            # local: enter_ip_state imports this module at load time
+            from .enter_ip_state import EnterIPState
+
+            self.state_manager.change_state(
+                EnterIPState(
+                    state_manager=self.state_manager,
+                    recent_connected=(
+                        ConfigManager.get_config().recent_connected or []
+                    ),
+                )
+            )
+        else:
+            ConfigManager.set_telemetry_mode(TelemetryMode.DEMO)
+            self._mode = TelemetryMode.DEMO
+        return True
+
     def adjust_brightness(self, delta_percent: int):
-        tentative_value = max(
-            10,
-            min(
-                100,
-                int(self.brightness_percent_value) + delta_percent,
-            ),
+        tentative_value = min(
+            100, max(10, self.brightness_percent_value + delta_percent)
         )
+        if tentative_value == self.brightness_percent_value:
+            return  # pinned at 10 % or 100 %, nothing to write
 
         # Only update internal state and label if write succeeds
         if self._backlight.set_percent(tentative_value):
@@ -34,27 +34,35 @@ class State(ABC):
         return False
 
     @abstractmethod
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect]:
         """
         Incremental dirty draw; states override.
+        Return the rects that changed, never the whole screen by default.
         """
         return []
 
     def enter(self, screen: pygame.Surface):
         self.screen = screen
 
-        self.background = pygame.Surface(screen.get_size()).convert()
-        self.background.fill(self.background_color())
+        # a state entered again on the same screen keeps its background
+        bg = self.background
+        if bg is None or bg.get_size() != screen.get_size():
+            bg = self.background = pygame.Surface(screen.get_size()).convert()
+            bg.fill(self.background_color())
 
-        # Let the concrete state add static stuff
-        self.draw_static_background(self.background)
+            # Let the concrete state add static stuff
+            self.draw_static_background(bg)
 
-        # Initial blit, StateManager.full_paint() will repaint anyway
-        screen.blit(self.background, (0, 0))
+        # no blit here: StateManager.draw() runs full_paint() next frame
 
         # Build sprite group (DirtySprites only)
         self.group = self.create_group()
 
+        # LayeredDirty keeps the background it is given and restores dirty
+        # areas by blitting from it, so hand over the prepared surface once
+        if self.group is not None:
+            self.group.clear(screen, self.background)
+
         # Ask manager to do a full update once
         return [screen.get_rect()]
 
@@ -66,17 +74,15 @@ class State(ABC):
 
     def full_paint(self, surface: pygame.Surface):
         """Paint whole background + sprites once."""
-        if self.background is not None:
-            surface.blit(self.background, (0, 0))
-
-        group = getattr(self, "group", None)
-        if group:
-            # Force all sprites to redraw on this pass
-            for sprite in group.sprites():
-                sprite.dirty = 1
-
-            group.clear(surface, self.background)
+        group = self.group
+        if group is not None:
+            # One screen-sized repaint area: draw() restores it from the
+            # background handed over in enter() and blits every visible
+            # sprite over it, dirty or not
+            group.repaint_rect(surface.get_rect())
             group.draw(surface)
+        elif self.background is not None:
+            surface.blit(self.background, (0, 0))
 
     def update(self, dt: float):
         """
@@ -92,17 +98,18 @@ class State(ABC):
         pass
 
     def request_delayed_transition(self, next_state, delay_seconds):
-        trigger_time = pygame.time.get_ticks() / 1000.0 + delay_seconds
-        self._pending_transition = (next_state, trigger_time)
+        # kept in integer ms, the unit of pygame.time.get_ticks()
+        trigger_ms = pygame.time.get_ticks() + int(delay_seconds * 1000)
+        self._pending_transition = (next_state, trigger_ms)
 
     def process_delayed_transition(self, state_manager: SupportsStateChange):
         """Call this from the state_manager or each state's update() every frame."""
-        if self._pending_transition:
-            _, trigger_time = self._pending_transition
-            now = pygame.time.get_ticks() / 1000.0
-            if now >= trigger_time:
-                next_state, _ = self._pending_transition
-                self._pending_transition = None
-                state_manager.change_state(next_state)
-                return True  # Transition occurred
-        return False
+        pending = self._pending_transition
+        if pending is None:
+            return False
+        next_state, trigger_ms = pending
+        if pygame.time.get_ticks() < trigger_ms:
+            return False
+        self._pending_transition = None
+        state_manager.change_state(next_state)
+        return True  # Transition occurred
@@ -4,9 +4,12 @@ from typing import List, Optional
 
 import pygame
 
+from ..logger import Logger
 from ..states.state import State
 from ..states.state_types import SupportsStateChange
 
+LOGGER = Logger("state_manager.py").get()
+
 
 class StateManager(SupportsStateChange):
     def __init__(self, screen: pygame.Surface, initial_state: Optional[State] = None):
@@ -24,36 +27,44 @@ class StateManager(SupportsStateChange):
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Dispatch event to base state stack."""
         # handle base states top to bottom
+        # try costs nothing until something raises (Python 3.11+); a failing
+        # state is logged with its traceback and the event moves on down
         for state in reversed(self._stack):
             try:
-                if bool(state.handle_event(event)):
+                if state.handle_event(event):
                     return True
-            except Exception as e:
-                print(e)
+            except Exception:
+                LOGGER.exception(f"{type(state).__name__}.handle_event failed")
         return False
 
     def update(self, dt: float):
-        """Update base states (snapshot) and all overlays."""
+        """Update the top state only; paused states below it are not ticked."""
+        state = self.current()
         try:
-            self.current().update(dt)
+            state.update(dt)
         except Exception:
             # Misbehaving state's update shouldn't break the loop
-            pass
+            LOGGER.exception(f"{type(state).__name__}.update failed")
 
     def current(self):
         return self._stack[-1]
 
-    def draw(self, surface: pygame.Surface):
-        s = self.current()
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        """
+        Draw the top state and return the changed rects, meant for
+        pygame.display.update(). The first call after a push/pop returns the
+        whole screen, which presents the initial composition.
+        """
+        s = self.current_state
         if not s:
             return []
 
         # If we have queued “full rects”, paint base + overlays once, then return those rects
-        if getattr(self, "_pending_rects", None):
+        if self._pending_rects:
             try:
                 s.full_paint(surface)  # base state
-            except Exception as e:
-                print("full_paint error:", e)
+            except Exception:
+                LOGGER.exception(f"{type(s).__name__}.full_paint failed")
             rects = self._pending_rects
             self._pending_rects = []
             return rects
@@ -71,8 +82,9 @@ class StateManager(SupportsStateChange):
             try:
                 top.exit()
             except Exception:
-                pass
-        self.push_state(new_state)
+                LOGGER.exception(f"{type(top).__name__}.exit failed")
+        # whatever is below was already paused when `top` was pushed
+        self._enter(new_state)
 
     def push_state(self, state: State):
         """
@@ -83,15 +95,18 @@ class StateManager(SupportsStateChange):
         if top is not None:
             try:
                 top.on_pause()
-            except Exception as e:
-                print(e)
+            except Exception:
+                LOGGER.exception(f"{type(top).__name__}.on_pause failed")
+        self._enter(state)
+
+    def _enter(self, state: State):
         state.state_manager = self
         self._stack.append(state)
         try:
             rects = state.enter(self._screen) or [self._screen.get_rect()]
             self._pending_rects = list(rects)
-        except Exception as e:
-            print(e)
+        except Exception:
+            LOGGER.exception(f"{type(state).__name__}.enter failed")
 
     def pop_state(self):
         if not self._stack:
@@ -101,7 +116,7 @@ class StateManager(SupportsStateChange):
         try:
             top.exit()
         except Exception:
-            pass
+            LOGGER.exception(f"{type(top).__name__}.exit failed")
         if self._stack:
             state = self._stack[-1]
             try:
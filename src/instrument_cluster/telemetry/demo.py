@@ -5,23 +5,19 @@ from .models import Flags, TelemetryFrame, Wheel, Wheels
 
 SHIFT_INTERVAL = 5.0  # seconds between gear changes
 SHIFT_PRE = 0.2  # seconds before change to show in_gear = False
+FRAME_PERIOD = 0.02  # seconds one synthesized frame is handed out again
 
 
 class DemoReader:
+    # angular speeds (rad/s) of the speed and rpm waves
+    _W_SPEED = 2 * math.pi / 6.0
+    _W_RPM = 2 * math.pi / 3.0
+    _INV_SHIFT = 1.0 / SHIFT_INTERVAL
+
     def __init__(self):
         self._t0 = time.perf_counter()
 
-    def start(self) -> None:
-        pass
-
-    def latest(self) -> TelemetryFrame:
-        t = time.perf_counter() - self._t0
-        speed = max(0.0, 35.0 + 15.0 * math.sin(2 * math.pi * (t / 6.0)))  # 38.62
-        rpm = int(6500 + 2000 * math.sin(2 * math.pi * (t / 3.0)))
-
-        # cycles every `SHIFT_INTERVAL` seconds: -1, 0, 1, 2, 3, 4, 5, 6
-        gear = -1 + int((t // SHIFT_INTERVAL) % 8)
-
+        # constant parts of every frame, validated once
         wheel = Wheel(
             suspension_height=0.0,
             radius=0.0,
@@ -29,22 +25,45 @@ class DemoReader:
             ground_speed=0.0,
             temperature=10.7,
         )
-
-        wheels = Wheels(
+        self._wheels = Wheels(
             front_left=wheel,
             front_right=wheel,
             rear_left=wheel,
             rear_right=wheel,
         )
+        self._flags = {
+            True: Flags(in_gear=True),
+            False: Flags(in_gear=False),
+        }
+
+        self._bucket = None
+        self._frame = None
+
+    def start(self) -> None:
+        pass
+
+    def latest(self) -> TelemetryFrame:
+        t = time.perf_counter() - self._t0
+
+        # callers polling faster than FRAME_PERIOD get the same frame, as is:
+        # published frames are read-only, like UdpJsonlReader's
+        bucket = int(t / FRAME_PERIOD)
+        if bucket == self._bucket:
+            return self._frame
+
+        speed = max(0.0, 35.0 + 15.0 * math.sin(t * self._W_SPEED))  # 38.62
+        rpm = int(6500 + 2000 * math.sin(t * self._W_RPM))
+
+        # cycles every `SHIFT_INTERVAL` seconds: -1, 0, 1, 2, 3, 4, 5, 6
+        k = int(t * self._INV_SHIFT)
+        gear = -1 + k % 8
 
-        k = int(t // SHIFT_INTERVAL)
         t_into = t - k * SHIFT_INTERVAL
         t_remaining = SHIFT_INTERVAL - t_into
         in_gear = not (t_remaining <= SHIFT_PRE)
 
-        flags = Flags(in_gear=in_gear)
-
-        return TelemetryFrame(
+        self._bucket = bucket
+        self._frame = TelemetryFrame(
             received_time=time.time_ns(),
             car_speed=speed,
             engine_rpm=rpm,
@@ -55,9 +74,10 @@ class DemoReader:
             lap_count=2,
             best_lap_time=97980,  # 0 + int((1000 * t)),
             last_lap_time=0,
-            flags=flags,
-            wheels=wheels,
+            flags=self._flags[in_gear],
+            wheels=self._wheels,
         )
+        return self._frame
 
     def stop(self) -> None:
         pass
@@ -26,13 +26,6 @@ class Vector(BaseModel):
     z: float = 0.0
 
 
-class Wheels(BaseModel):
-    front_left: Wheel
-    front_right: Wheel
-    rear_left: Wheel
-    rear_right: Wheel
-
-
 class Wheel(BaseModel):
     suspension_height: float = Field(ge=0, le=1)
     radius: float  # in meters
@@ -41,6 +34,13 @@ class Wheel(BaseModel):
     temperature: float
 
 
+class Wheels(BaseModel):
+    front_left: Wheel
+    front_right: Wheel
+    rear_left: Wheel
+    rear_right: Wheel
+
+
 class Bounds(BaseModel):
     min: float = 0.0
     max: float = 1000.0
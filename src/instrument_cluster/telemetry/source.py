@@ -10,23 +10,66 @@ class TelemetrySource:
         host: str = "127.0.0.1",
         port: int = 5600,
     ):
+        self._mode: TelemetryMode | None = None
+        self._readers: dict[TelemetryMode, DemoReader | UdpJsonlReader] = {}
+        self._running = False
+        self.reader = None
+        self.reconfigure(mode, host=host, port=port)
+
+    @property
+    def mode(self) -> TelemetryMode | None:
+        return self._mode
+
+    def reconfigure(
+        self,
+        mode: TelemetryMode | str | None,
+        host: str = "127.0.0.1",
+        port: int = 5600,
+    ) -> None:
+        """
+        Switch to `mode` in place. Readers are kept per mode and reused, a UDP
+        reader is only rebuilt when its address changes. If the source is
+        running, the new reader is started before the old one is stopped, so a
+        failed start leaves the current reader in charge.
+        """
         if mode is None:
             mode = TelemetryMode.DEMO
         elif isinstance(mode, str):
             mode = TelemetryMode(mode)
+
+        reader = self._readers.get(mode)
+        if mode is TelemetryMode.UDP:
+            if reader is None or reader.addr != (host, port):
+                reader = UdpJsonlReader(host=host, port=port)
+        elif reader is None:
+            reader = DemoReader()
+
+        if reader is self.reader:
+            return
+
+        if self._running:
+            reader.start()
+            self._stop_reader(self.reader)
+        self._readers[mode] = reader
+        self.reader = reader
         self._mode = mode
-        self.reader = (
-            UdpJsonlReader(host=host, port=port)
-            if mode is TelemetryMode.UDP
-            else DemoReader()
-        )
 
     def start(self) -> None:
         self.reader.start()
+        self._running = True
 
     def latest(self):
+        """
+        Most recent frame of the active reader. Never raises: both readers
+        only hand out a frame they already hold or synthesise.
+        """
         return self.reader.latest()
 
     def stop(self) -> None:
-        if hasattr(self.reader, "stop"):
-            self.reader.stop()
+        self._running = False
+        self._stop_reader(self.reader)
+
+    @staticmethod
+    def _stop_reader(reader) -> None:
+        if hasattr(reader, "stop"):
+            reader.stop()
@@ -1,11 +1,20 @@
-import json
+import select
 import socket
 import threading
 import time
 from typing import Optional, Tuple
 
+from pydantic import TypeAdapter, ValidationError
+
+from ..logger import Logger
 from .models import TelemetryFrame
 
+LOGGER = Logger("udp_jsonl.py").get()
+
+# one validator handle for the receive loop, built when the module loads
+_FRAME_ADAPTER = TypeAdapter(TelemetryFrame)
+WARN_INTERVAL = 1.0  # seconds between "dropped datagram" warnings
+
 
 class UdpJsonlReader:
     def __init__(
@@ -13,9 +22,11 @@ class UdpJsonlReader:
         host: str = "127.0.0.1",
         port: int = 5600,
         bufsize: int = 4096,
+        rcvbuf: int = 1 << 20,
     ):
         self.addr: Tuple[str, int] = (host, port)
         self.bufsize = bufsize
+        self.rcvbuf = rcvbuf  # kernel queue; Linux caps it at net.core.rmem_max
         self._sock: Optional[socket.socket] = None
         self._thread: Optional[threading.Thread] = None
         self._running = False
@@ -27,7 +38,9 @@ class UdpJsonlReader:
             return
         self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         # receive-only on configured address
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
         self._sock.bind(self.addr)
+        # _run() sleeps in select() and then drains with non-blocking reads
         self._sock.setblocking(False)
         self._running = True
         self._thread = threading.Thread(target=self._run, daemon=True)
@@ -35,24 +48,55 @@ class UdpJsonlReader:
 
     def _run(self) -> None:
         """Internal thread loop that receives and parses UDP frames."""
-        assert self._sock is not None
-        while self._running:
+        sock = self._sock
+        assert sock is not None
+        # every read lands in this one buffer; only the parsed datagram is copied
+        buf = bytearray(self.bufsize)
+        dropped = 0  # invalid datagrams since the last warning
+        last_warn = -WARN_INTERVAL
+        # a stop() + start() pair gets a new socket and thread; this one quits
+        while self._running and self._sock is sock:
+            # the kernel wakes the thread per datagram; the timeout bounds how
+            # long a stop() waits for the loop to notice
             try:
-                data, _ = self._sock.recvfrom(self.bufsize)
-            except BlockingIOError:
-                time.sleep(0.002)
+                ready, _, _ = select.select((sock,), (), (), 0.5)
+            except (OSError, ValueError):
+                break  # closed under us
+            if not ready:
                 continue
+            # only the newest frame is surfaced, so drain the queue and
+            # validate just the last datagram
+            nbytes = None
+            try:
+                while True:
+                    nbytes, _ = sock.recvfrom_into(buf)
+            except BlockingIOError:
+                pass
             except OSError:
                 break
+            if nbytes is None:
+                continue
             try:
-                obj = json.loads(data.decode("utf-8"))
-                self._latest = TelemetryFrame.model_validate(obj)
-            except Exception as e:
-                print(str(e))
+                # one pass from bytes: no str decode, no intermediate dict
+                self._latest = _FRAME_ADAPTER.validate_json(buf[:nbytes])
+            except ValidationError as e:
+                # a broken producer may send nothing else; warn at most once
+                # per WARN_INTERVAL instead of once per datagram
+                dropped += 1
+                now = time.monotonic()
+                if now - last_warn >= WARN_INTERVAL:
+                    LOGGER.warning(f"Dropped {dropped} telemetry datagram(s): {e}")
+                    dropped = 0
+                    last_warn = now
 
     def latest(self) -> TelemetryFrame:
         """
         Return the most recently received telemetry frame.
+
+        Lock-free: the reader thread builds each frame completely and then
+        publishes it with a single attribute store, which is atomic, so a
+        caller always gets a whole frame, never a half-built one. Frames are
+        not mutated after publishing; treat the returned one as read-only.
         """
         return self._latest
 
@@ -8,8 +8,9 @@ LAP_DEFAULT_VALUE = 0.0
 # ------------------------
 # UI
 # ------------------------
-SCREEN_WIDTH = ConfigManager.get_config().width
-SCREEN_HEIGHT = ConfigManager.get_config().height
+_config = ConfigManager.get_config()
+SCREEN_WIDTH = _config.width
+SCREEN_HEIGHT = _config.height
 
 BUTTON_HEIGHT = 72
 
@@ -26,3 +26,13 @@ ENTER_IP_DEL_BUTTON_RELEASED = pygame.event.custom_type()
 
 INSTALL_PRESSED = pygame.event.custom_type()
 INSTALL_RELEASED = pygame.event.custom_type()
+
+# input that buttons react to; states can skip their button groups for the rest
+POINTER_EVENTS = frozenset(
+    (
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.FINGERDOWN,
+        pygame.FINGERUP,
+    )
+)
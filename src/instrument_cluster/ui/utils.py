@@ -1,24 +1,50 @@
 from __future__ import annotations
 
+import functools
+from contextlib import ExitStack
 from enum import Enum
 from importlib.resources import as_file, files
 
 import pygame
 
-_font_cache: dict[tuple[FontFamily, int], pygame.font.Font] = {}
-
 
 def load_font(size: int, family: FontFamily) -> pygame.font.Font:
-    key = (family, size)
-    if key in _font_cache:
-        return _font_cache[key]
+    """
+    Return the shared Font for (family, size); the TTF is opened and parsed
+    only on the first request, later states and widgets get the same object.
+    Needs pygame.font initialised, so call it from constructors, not at import.
+    """
+    # one positional key however the caller spelled the arguments
+    return _load_font(family, size)
 
-    font_res = files("instrument_cluster").joinpath(family.relpath)
-    with as_file(font_res) as font_path:
-        font = pygame.font.Font(str(font_path), size)
 
-    _font_cache[key] = font
-    return font
+@functools.cache
+def _load_font(family: FontFamily, size: int) -> pygame.font.Font:
+    return pygame.font.Font(_font_path(family), size)
+
+
+@functools.lru_cache(maxsize=256)
+def render_text(
+    font: pygame.font.Font, text: str, antialias: bool, color: tuple
+) -> pygame.Surface:
+    """
+    Cached font.render() for short strings that keep coming back (gear
+    letters, signs, stray glyphs). The Surface is shared: blit it, never
+    draw into it.
+    """
+    return font.render(text, antialias, color)
+
+
+# keeps as_file() results alive for the whole process; only a zipped install
+# needs it, where each one is a temporary extracted copy
+_font_files = ExitStack()
+
+
+@functools.cache
+def _font_path(family: FontFamily) -> str:
+    """Filesystem path of the family's TTF, resolved once per family."""
+    font_res = files("instrument_cluster").joinpath(family.relpath)
+    return str(_font_files.enter_context(as_file(font_res)))
 
 
 class FontFamily(Enum):
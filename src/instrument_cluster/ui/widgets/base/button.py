@@ -1,12 +1,14 @@
+import functools
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Literal, Optional, Tuple
+from typing import Iterable, Literal, Optional, Tuple
 
 import pygame
 from pygame.sprite import DirtySprite
 
 from ...colors import Color
-from ...utils import FontFamily, load_font
+from ...events import POINTER_EVENTS
+from ...utils import FontFamily, load_font, render_text
 from .container import Container
 
 """Lightweight button widgets for Pygame with text+icon layout.
@@ -27,6 +29,22 @@ Performance:
 Rebuilds occur only when inputs that affect visuals change.
 """
 
+# event-type sets for the per-event checks below
+_MOUSE_EVENTS = frozenset(
+    (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+)
+_FINGER_EVENTS = frozenset((pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION))
+_DOWN_EVENTS = frozenset((pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN))
+
+# display size used to scale finger coordinates; filled on first use
+_screen_size_cache: Optional[Tuple[int, int]] = None
+
+
+def invalidate_screen_size() -> None:
+    """Forget the cached display size; call after the window is resized."""
+    global _screen_size_cache
+    _screen_size_cache = None
+
 
 class ButtonState(Enum):
     IDLE = auto()
@@ -52,14 +70,17 @@ class AbstractButton(DirtySprite):
 
     Args:
         rect: Button rectangle (x, y, w, h).
-        event_type_pressed: Pygame event type to post on *first* press
-            (e.g., `pygame.USEREVENT + 1`).
-        event_type_released: Pygame event type to post on release *inside*
-            the button (e.g., `pygame.USEREVENT + 2`).
+        events: `ButtonEvents` with the Pygame event types to post on the
+            *first* press, on release *inside* the button and, optionally, on
+            a long press (e.g., `pygame.event.custom_type()` values).
         event_data: Optional dict added as event attributes when posting
             pressed/released events.
     """
 
+    # True if the button must also see presses outside its rect; ButtonGroup
+    # skips idle buttons that don't contain the pointer otherwise
+    needs_outside_events = False
+
     def __init__(
         self,
         rect,
@@ -103,8 +124,13 @@ class AbstractButton(DirtySprite):
 
     @staticmethod
     def _screen_size():
-        surf = pygame.display.get_surface()
-        return surf.get_size() if surf else (0, 0)
+        global _screen_size_cache
+        if _screen_size_cache is None:
+            surf = pygame.display.get_surface()
+            if surf is None:
+                return (0, 0)  # no display yet; don't cache that
+            _screen_size_cache = surf.get_size()
+        return _screen_size_cache
 
     @staticmethod
     def _event_xy(event):
@@ -113,13 +139,9 @@ class AbstractButton(DirtySprite):
         - MOUSE*  -> event.pos
         - FINGER* -> (event.x * w, event.y * h)
         """
-        if event.type in (
-            pygame.MOUSEBUTTONDOWN,
-            pygame.MOUSEBUTTONUP,
-            pygame.MOUSEMOTION,
-        ):
+        if event.type in _MOUSE_EVENTS:
             return event.pos
-        if event.type in (pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION):
+        if event.type in _FINGER_EVENTS:
             w, h = AbstractButton._screen_size()
             return int(event.x * w), int(event.y * h)
         return None
@@ -133,17 +155,18 @@ class AbstractButton(DirtySprite):
 
     def handle_event(self, event):
         prev_state = self.state
+        # only presses and releases; everything past here is a down or an up
+        if event.type not in POINTER_EVENTS:
+            return
         # Normalize to a "pointer id":
         # - mouse -> 0
         # - touch -> event.finger_id
-        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        if event.type in _MOUSE_EVENTS:
             pid = 0
-        elif event.type in (pygame.FINGERDOWN, pygame.FINGERUP):
-            pid = getattr(event, "finger_id", None)
         else:
-            return
+            pid = getattr(event, "finger_id", None)
 
-        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN):
+        if event.type in _DOWN_EVENTS:
             if self.is_inside(event):
                 if self.state != ButtonState.PRESSED:
                     pygame.event.post(
@@ -154,7 +177,7 @@ class AbstractButton(DirtySprite):
                 self._long_fired = False
                 self._pressed_time = 0.0
 
-        elif event.type in (pygame.MOUSEBUTTONUP, pygame.FINGERUP):
+        else:
             if self.state == ButtonState.PRESSED and self._active_pointer == pid:
                 if self.is_inside(event):
                     if not self._long_fired:
@@ -201,6 +224,9 @@ class AbstractButton(DirtySprite):
 class ButtonGroup(Container):
     """A positioned container that manages multiple buttons."""
 
+    # event types any button reacts to; owners can skip handle_event() for others
+    handled_types = POINTER_EVENTS
+
     def __init__(
         self,
         buttons: list[AbstractButton] | None = None,
@@ -214,12 +240,33 @@ class ButtonGroup(Container):
     def add_button(self, button: AbstractButton) -> None:
         self.add(button)
 
-    def extend_buttons(self, buttons: list[AbstractButton]) -> None:
+    def extend_buttons(self, buttons: Iterable[AbstractButton]) -> None:
         self.add(*buttons)
 
     def sprites(self):
         return super().sprites()
 
+    def handle_event(self, event) -> None:
+        """Forward pointer events only to the buttons they can affect.
+
+        The event position is resolved once. Idle buttons that do not contain
+        it are skipped; a button holding a press always gets the event, since
+        a release outside its rect still has to reset it.
+        """
+        if not self.is_visible:
+            return
+        xy = AbstractButton._event_xy(event)
+        if xy is None:
+            return  # buttons only react to pointer input
+        for w in self._children:
+            if (
+                w._active_pointer is None
+                and not w.needs_outside_events
+                and not w.rect.collidepoint(xy)
+            ):
+                continue
+            w.handle_event(event)
+
 
 class Button(AbstractButton):
     """A rectangular Pygame button that can render **text** and an **icon**.
@@ -230,11 +277,12 @@ class Button(AbstractButton):
     Args:
         rect: Button rectangle (x, y, w, h).
         text: Label string to render.
-        event_type_pressed: Pygame event type to post on press.
-        event_type_released: Pygame event type to post on valid release.
-        event_data: Optional dict attached to posted events.
+        events: `ButtonEvents` to post on press/release; if `None`, the
+            button posts `pygame.NOEVENT`.
+        event_data: Optional dict attached to posted events; defaults to
+            `{"label": text}`.
         font: `pygame.font.Font` for the text; if `None`, a default is loaded.
-        color: RGB tuple for the text and (by default) icon.
+        text_color: RGB tuple for the text and (by default) icon.
         antialias: Whether to antialias text/icon glyphs. Defaults to False.
 
         icon: Optional **glyph string** for the icon (e.g., Material Symbols
@@ -430,8 +478,9 @@ class Button(AbstractButton):
             self._font_fingerprint(self.font),
         )
         if key != self._cache["text_key"]:
-            self._cache["text_surf"] = self.font.render(
-                self._text, self.antialias, self.color
+            # shared with every other button showing the same label
+            self._cache["text_surf"] = render_text(
+                self.font, self._text, self.antialias, self.color
             )
             self._cache["text_key"] = key
         return self._cache["text_surf"]
@@ -446,8 +495,8 @@ class Button(AbstractButton):
         fnt = self.icon_font or self.font
         key = (self.icon, self.icon_color, self.antialias, self._font_fingerprint(fnt))
         if key != self._cache["icon_key"]:
-            self._cache["icon_surf"] = fnt.render(
-                self.icon, self.antialias, self.icon_color
+            self._cache["icon_surf"] = render_text(
+                fnt, self.icon, self.antialias, self.icon_color
             )
             self._cache["icon_key"] = key
         return self._cache["icon_surf"]
@@ -704,26 +753,15 @@ class Button(AbstractButton):
             )
 
         # Border
-        if (
-            self.border_bottom_right_radius is not None
-            and self.border_top_right_radius is not None
-        ):
-            pygame.draw.rect(
-                composed,
+        composed.blit(
+            self._border_outline(
+                self.rect.size,
                 border_color,
-                composed.get_rect(),
-                width=2,
-                border_bottom_right_radius=self.border_bottom_right_radius,
-                border_top_right_radius=self.border_top_right_radius,
-            )
-        else:
-            pygame.draw.rect(
-                composed,
-                border_color,
-                composed.get_rect(),
-                width=2,
-                border_radius=4,
-            )
+                self.border_top_right_radius,
+                self.border_bottom_right_radius,
+            ),
+            (0, 0),
+        )
 
         # Content (convert absolute positions to local coords in composed surface)
         if icon_surf is not None and icon_x is not None:
@@ -736,10 +774,40 @@ class Button(AbstractButton):
         return composed
 
     @staticmethod
-    def _lerp(a: int, b: int, t: float) -> int:
-        return a + int((b - a) * t)
+    @functools.cache
+    def _border_outline(
+        size: Tuple[int, int],
+        color: Tuple[int, int, int],
+        top_right_radius: Optional[int],
+        bottom_right_radius: Optional[int],
+    ) -> pygame.Surface:
+        """Return the 2 px rounded border on a transparent Surface.
+
+        Shared by every button with the same size, color and corners: blit it,
+        never draw into it.
+        """
+        outline = pygame.Surface(size, pygame.SRCALPHA)
+        if bottom_right_radius is not None and top_right_radius is not None:
+            pygame.draw.rect(
+                outline,
+                color,
+                outline.get_rect(),
+                width=2,
+                border_bottom_right_radius=bottom_right_radius,
+                border_top_right_radius=top_right_radius,
+            )
+        else:
+            pygame.draw.rect(
+                outline,
+                color,
+                outline.get_rect(),
+                width=2,
+                border_radius=4,
+            )
+        return outline
 
     @staticmethod
+    @functools.cache
     def _rounded_mask(size: Tuple[int, int], radius: int = 4) -> pygame.Surface:
         w, h = size
         m = pygame.Surface((w, h), pygame.SRCALPHA)
@@ -758,25 +826,25 @@ class Button(AbstractButton):
         if key == self._grad_cache["key"] and self._grad_cache["surf"] is not None:
             return self._grad_cache["surf"]
 
-        w, h = size
-        grad = pygame.Surface((w, h), pygame.SRCALPHA)
+        import numpy as np  # only needed once per gradient; keep it off startup
 
+        w, h = size
+        # one color per column (horizontal) or row, then stretched across the
+        # other axis; surfarray wants the pixels indexed [x, y, channel]
+        n = w if horizontal else h
+        t = np.arange(n) / max(1, n - 1)
+        a = np.array(c1[:3])
+        ramp = (a + ((np.array(c2[:3]) - a) * t[:, None]).astype(int)).astype(np.uint8)
+        shape = (w, h, 3)
         if horizontal:
-            # one vertical strip per x
-            for x in range(w):
-                t = x / max(1, w - 1)
-                r = self._lerp(c1[0], c2[0], t)
-                g = self._lerp(c1[1], c2[1], t)
-                b = self._lerp(c1[2], c2[2], t)
-                pygame.draw.line(grad, (r, g, b), (x, 0), (x, h - 1))
+            pixels = np.broadcast_to(ramp[:, None, :], shape)
         else:
-            # one horizontal strip per y
-            for y in range(h):
-                t = y / max(1, h - 1)
-                r = self._lerp(c1[0], c2[0], t)
-                g = self._lerp(c1[1], c2[1], t)
-                b = self._lerp(c1[2], c2[2], t)
-                pygame.draw.line(grad, (r, g, b), (0, y), (w - 1, y))
+            pixels = np.broadcast_to(ramp[None, :, :], shape)
+
+        opaque = pygame.Surface((w, h))
+        pygame.surfarray.blit_array(opaque, np.ascontiguousarray(pixels))
+        grad = pygame.Surface((w, h), pygame.SRCALPHA)
+        grad.blit(opaque, (0, 0))  # RGB source: alpha comes out 255
 
         if radius and radius > 0:
             mask = self._rounded_mask((w, h), radius)
@@ -787,15 +855,12 @@ class Button(AbstractButton):
         return grad
 
     def draw(self, surface):
-        """Render the button onto `surface`, using caches where possible."""
+        """Blit the button onto `surface`.
 
-        text_surf = self._ensure_text_surface()
-        icon_surf = self._ensure_icon_surface()
-
-        pos = self._ensure_layout(text_surf, icon_surf)
-
-        composed = self._ensure_composite(text_surf, icon_surf, pos)
-        surface.blit(composed, self.rect)
+        `self.image` is rebuilt by `_on_visual_change()` whenever the text or
+        the press state changes, so drawing never has to re-check the caches.
+        """
+        surface.blit(self.image, self.rect)
 
     @property
     def text(self):
@@ -1,10 +1,19 @@
 import pygame
 
 from ...colors import Color
+from ...utils import render_text
 from .button import AbstractButton, Button, ButtonState
 
+_PTR_DOWN = frozenset((pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN))
+_PTR_UP = frozenset((pygame.MOUSEBUTTONUP, pygame.FINGERUP))
+_PTR_EVENTS = _PTR_DOWN | _PTR_UP | {pygame.MOUSEMOTION, pygame.FINGERMOTION}
+_MOUSE_BUTTON_EVENTS = frozenset((pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP))
+
 
 class Dropdown(Button):
+    # a press anywhere outside an open menu collapses it
+    needs_outside_events = True
+
     def __init__(
         self,
         rect,
@@ -85,16 +94,12 @@ class Dropdown(Button):
         if not hasattr(self, "_menu_active_pid"):
             self._menu_active_pid = None
 
-        ptr_down = (pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN)
-        ptr_up = (pygame.MOUSEBUTTONUP, pygame.FINGERUP)
-        ptr_evt = ptr_down + ptr_up + (pygame.MOUSEMOTION, pygame.FINGERMOTION)
-
-        if event.type not in ptr_evt:
+        if event.type not in _PTR_EVENTS:
             super().handle_event(event)
             return
 
         # normalize pointer + coords
-        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        if event.type in _MOUSE_BUTTON_EVENTS:
             pid = 0
         else:
             pid = getattr(event, "finger_id", None)
@@ -114,7 +119,7 @@ class Dropdown(Button):
             menu_rect, item_rects = self._expanded_menu_geometry()
 
             # PRESS in menu (but not on face): start capture and consume
-            if event.type in ptr_down:
+            if event.type in _PTR_DOWN:
                 if menu_rect.collidepoint(x, y) and not base_rect.collidepoint(x, y):
                     self._menu_active_index = None
                     for i, r in enumerate(item_rects):
@@ -135,7 +140,7 @@ class Dropdown(Button):
                 # press on face while expanded -> let Button show gradient; fall through
 
             # RELEASE: select only if same pointer + same item
-            if event.type in ptr_up and self._menu_active_pid == pid:
+            if event.type in _PTR_UP and self._menu_active_pid == pid:
                 if self._menu_active_index is not None:
                     idx = self._menu_active_index
                     if 0 <= idx < len(item_rects) and item_rects[idx].collidepoint(
@@ -244,7 +249,7 @@ class Dropdown(Button):
 
             # label
             label = opt.name if hasattr(opt, "name") else str(opt)
-            ts = self.font.render(label.title(), self.antialias, self.color)
+            ts = render_text(self.font, label.title(), self.antialias, self.color)
             extended.blit(ts, (20, y + (h - ts.get_height()) // 2))
 
         # Swap in the extended image and grow the rect so LayeredDirty will blit the whole menu
@@ -5,6 +5,9 @@ from .label import Label
 
 
 class TextField(Label):
+    # event types handle_event() reacts to
+    handled_types = frozenset((pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN))
+
     def __init__(
         self,
         text,
@@ -28,6 +31,9 @@ class TextField(Label):
         self.border_color = border_color
         self.background_color = background_color
         self.active = False
+        # rendered text, reused while only the caret blinks
+        self._text_key = None
+        self._text_surf = None
 
         # --- IMPORTANT: define fixed box geometry BEFORE super().__init__ ---
         self._box_size = (width, height)
@@ -56,7 +62,11 @@ class TextField(Label):
 
         # Text (left padding)
         left_pad = 10
-        text_surf = self.font.render(self.text, self.antialias, self.color)
+        key = (self.text, self.font, self.color, self.antialias)
+        if key != self._text_key:
+            self._text_surf = self.font.render(self.text, self.antialias, self.color)
+            self._text_key = key
+        text_surf = self._text_surf
         text_rect = text_surf.get_rect()
         text_rect.left = left_pad
         text_rect.centery = h // 2
@@ -9,7 +9,7 @@ from ...logger import Logger
 from ...telemetry.feed import Feed
 from ...telemetry.models import TelemetryFrame
 from ..colors import Color
-from ..utils import FontFamily, load_font
+from ..utils import FontFamily, load_font, render_text
 
 
 class DeltaTimeWidget(DirtySprite):
@@ -213,7 +213,7 @@ class DeltaTimeWidget(DirtySprite):
             slot_w = advances[i]
             ch_surf = surf_map.get(ch)
             if ch_surf is None:
-                ch_surf = self.font_value.render(ch, self.antialias, color)
+                ch_surf = render_text(self.font_value, ch, self.antialias, color)
             gx = x + (slot_w - ch_surf.get_width()) // 2
             gy = y + (digit_h - ch_surf.get_height()) // 2
             self.image.blit(ch_surf, (gx, gy))
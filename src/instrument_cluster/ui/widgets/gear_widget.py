@@ -3,7 +3,7 @@ from pygame.sprite import DirtySprite
 
 from ...telemetry.models import TelemetryFrame
 from ..colors import Color
-from ..utils import FontFamily, load_font
+from ..utils import FontFamily, load_font, render_text
 
 
 class GearWidget(DirtySprite):
@@ -99,7 +99,9 @@ class GearWidget(DirtySprite):
 
         pygame.draw.rect(self.image, self.bg_color, value_area)
 
-        value_surf = self.font_value.render(gear_str, self.antialias, self.text_color)
+        value_surf = render_text(
+            self.font_value, gear_str, self.antialias, self.text_color
+        )
         value_rect = value_surf.get_rect(center=(self.w // 2, self.h // 2))
 
         self.image.blit(value_surf, value_rect)
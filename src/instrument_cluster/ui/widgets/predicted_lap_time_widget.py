@@ -7,7 +7,7 @@ from ...telemetry.feed import Feed
 from ...telemetry.models import TelemetryFrame
 from ..colors import Color
 from ..constants import LAP_DEFAULT_VALUE
-from ..utils import FontFamily, load_font
+from ..utils import FontFamily, load_font, render_text
 
 
 class PredictedLapTimeWidget(DirtySprite):
@@ -148,7 +148,7 @@ class PredictedLapTimeWidget(DirtySprite):
             slot_w = advances[i]
             surf = self._digit_surf.get(ch)
             if surf is None:
-                surf = self.font_value.render(ch, self.antialias, self.text_color)
+                surf = render_text(self.font_value, ch, self.antialias, self.text_color)
 
             # center glyph inside its (possibly narrower) slot
             gx = x + (slot_w - surf.get_width()) // 2
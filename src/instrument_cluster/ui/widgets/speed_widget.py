@@ -3,7 +3,7 @@ from pygame.sprite import DirtySprite
 
 from ...telemetry.models import TelemetryFrame
 from ..colors import Color
-from ..utils import FontFamily, load_font
+from ..utils import FontFamily, load_font, render_text
 
 
 class SpeedWidget(DirtySprite):
@@ -121,7 +121,7 @@ class SpeedWidget(DirtySprite):
             surf = self._digit_surf.get(ch)
             if surf is None:
                 # render on the fly
-                surf = self.font_value.render(ch, self.antialias, self.text_color)
+                surf = render_text(self.font_value, ch, self.antialias, self.text_color)
             # center this glyph inside its slot
             gx = x + (self._advance - surf.get_width()) // 2
             gy = y + (self._digit_h - surf.get_height()) // 2